@@ -2,21 +2,34 @@ import streamlit as st
 import re
 import json
 import hashlib
-from typing import Dict, List
-from dataclasses import dataclass
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List
+from dataclasses import dataclass, replace
 from datetime import datetime
-import tempfile
-import os
+from io import BytesIO
+import numpy as np
+import pandas as pd
 
-# Document Processing
+# Skill Matching
 try:
-    import PyPDF2
-    import pdfplumber
-    import docx2txt
-    from docx import Document
-    PDF_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
+
+# Linear-time regex engine for the section patterns
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Fuzzy Skill Matching
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # Configure Streamlit
 st.set_page_config(
@@ -73,29 +86,29 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Data Classes
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JobDescription:
     id: str
     title: str
     company: str
-    must_have_skills: List[str]
-    good_to_have_skills: List[str]
+    must_have_skills: FrozenSet[str]
+    good_to_have_skills: FrozenSet[str]
     experience_required: str
     description: str
     location: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Resume:
     id: str
     name: str
     email: str
-    skills: List[str]
+    skills: FrozenSet[str]
     experience: List[Dict]
     education: List[Dict]
     projects: List[Dict]
     raw_text: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationResult:
     resume_id: str
     job_id: str
@@ -110,30 +123,20 @@ class EvaluationResult:
 class DocumentProcessor:
     @staticmethod
     def extract_text_from_pdf(file_bytes) -> str:
-        if not PDF_AVAILABLE:
-            return ""
-        
+        # Each library is imported on first use so page loads that never
+        # extract a PDF skip the import cost; later calls hit sys.modules
         text = ""
         try:
-            # Try pdfplumber first
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(file_bytes)
-                tmp_path = tmp_file.name
-            
+            # Try PyMuPDF first, it reads straight from the uploaded bytes
             try:
-                with pdfplumber.open(tmp_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                import pymupdf
+                with pymupdf.open(stream=file_bytes, filetype='pdf') as doc:
+                    text = "\n".join(page.get_text('text') for page in doc)
             except:
-                # Fallback to PyPDF2
-                with open(tmp_path, 'rb') as file:
-                    reader = PyPDF2.PdfReader(file)
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
-            
-            os.unlink(tmp_path)
+                # Fallback to PyPDF2 (also covers PyMuPDF not being installed)
+                import PyPDF2
+                reader = PyPDF2.PdfReader(BytesIO(file_bytes))
+                text = "\n".join(page.extract_text() for page in reader.pages)
         except Exception as e:
             st.error(f"PDF processing failed: {str(e)}")
         
@@ -143,21 +146,16 @@ class DocumentProcessor:
     def extract_text_from_docx(file_bytes) -> str:
         text = ""
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                tmp_file.write(file_bytes)
-                tmp_path = tmp_file.name
-            
-            try:
-                text = docx2txt.process(tmp_path)
-                if not text:
-                    doc = Document(tmp_path)
-                    text = "\n".join([para.text for para in doc.paragraphs])
-            except Exception as e:
-                st.error(f"DOCX processing failed: {str(e)}")
+            import docx2txt
+            from docx import Document
             
-            os.unlink(tmp_path)
+            # Both readers open the .docx zip archive from a file-like object
+            text = docx2txt.process(BytesIO(file_bytes))
+            if not text:
+                doc = Document(BytesIO(file_bytes))
+                text = "\n".join([para.text for para in doc.paragraphs])
         except Exception as e:
-            st.error(f"File processing failed: {str(e)}")
+            st.error(f"DOCX processing failed: {str(e)}")
         
         return text.strip()
     
@@ -169,106 +167,204 @@ class DocumentProcessor:
         file_ext = uploaded_file.name.split('.')[-1].lower()
         file_bytes = uploaded_file.getvalue()
         
-        if file_ext == 'pdf':
-            return DocumentProcessor.extract_text_from_pdf(file_bytes)
-        elif file_ext in ['docx', 'doc']:
-            return DocumentProcessor.extract_text_from_docx(file_bytes)
-        elif file_ext == 'txt':
-            return file_bytes.decode('utf-8')
+        return _extract_text_cached(file_bytes, file_ext)
+
+# Parsing Patterns (compiled once at import instead of on every parse)
+def _compile_pattern(pattern: str):
+    # RE2 compiles to an automaton with no backtracking; it spells the
+    # end-of-text anchor \z and only takes flags inline
+    if RE2_AVAILABLE:
+        return re2.compile('(?i)' + pattern.replace(r'\Z', r'\z'))
+    return re.compile(pattern, re.IGNORECASE)
+
+_SKILL_DELIMS = str.maketrans({c: ',' for c in ';|\n•-'})
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+_SKILLS_SECTION_RE = _compile_pattern(r'skills?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)')
+_EXPERIENCE_SECTION_RE = _compile_pattern(r'experience\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)')
+_PROJECTS_SECTION_RE = _compile_pattern(r'projects?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)')
+
+_TITLE_PATTERNS = [_compile_pattern(p) for p in (
+    r'job\s*title\s*:?\s*([^\n]+)',
+    r'position\s*:?\s*([^\n]+)',
+    r'role\s*:?\s*([^\n]+)',
+)]
+_MUST_HAVE_PATTERNS = [_compile_pattern(p) for p in (
+    r'required\s*skills?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+    r'must\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+    r'mandatory\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+)]
+_GOOD_TO_HAVE_PATTERNS = [_compile_pattern(p) for p in (
+    r'good\s*to\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+    r'preferred\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+    r'nice\s*to\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
+)]
+_EXP_PATTERNS = [_compile_pattern(p) for p in (
+    r'(\d+[\+\-]?\d*)\s*years?\s*(?:of\s*)?experience',
+    r'experience\s*:?\s*(\d+[\+\-]?\d*)\s*years?',
+)]
+
+# Skill Vocabularies
+TECH_SKILLS = frozenset([
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
+    'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws', 'azure',
+    'gcp', 'git', 'jenkins', 'machine learning', 'deep learning', 'nlp',
+    'data science', 'sql', 'mongodb', 'postgresql', 'mysql', 'html', 'css',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'c++',
+    'devops', 'agile', 'scrum', 'analytics', 'tableau', 'powerbi'
+])
+JD_FALLBACK_SKILLS = frozenset(['python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker'])
+DEGREES = ('bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'mba', 'b.e', 'm.e', 'bsc', 'msc')
+
+# Common abbreviations and spellings mapped to one canonical skill name.
+# These are unambiguous enough to look for anywhere in the text
+SKILL_ALIASES = {
+    'js': 'javascript', 'k8s': 'kubernetes', 'cpp': 'c++',
+    'nodejs': 'node.js', 'reactjs': 'react', 'react.js': 'react',
+    'vuejs': 'vue', 'vue.js': 'vue', 'angularjs': 'angular', 'postgres': 'postgresql',
+    'mongo': 'mongodb', 'sklearn': 'scikit-learn', 'power bi': 'powerbi',
+    'amazon web services': 'aws', 'google cloud': 'gcp'
+}
+# Aliases that are also ordinary words ("cluster node", "tf" as a file
+# suffix), trusted only inside an explicit skills list
+SECTION_SKILL_ALIASES = {
+    **SKILL_ALIASES,
+    'node': 'node.js', 'ml': 'machine learning', 'dl': 'deep learning', 'tf': 'tensorflow'
+}
+# Fuzzy skill matching. One extra letter scores 2n/(2n+1) with fuzz.ratio
+# (react/preact 90.9, css/scss 85.7), so short JD skills are only matched
+# exactly and mid-length ones need a higher similarity (0-100)
+FUZZY_MIN_SKILL_LENGTH = 6
+FUZZY_LONG_SKILL_LENGTH = 10
+FUZZY_SKILL_CUTOFF = 85
+FUZZY_SHORT_SKILL_CUTOFF = 90
+
+# Characters that glue a skill onto the token before it ("x+python",
+# "#aws", the "js" in "node.js"), so a match right after them is rejected
+_WORD_JOINERS = '+#.'
+
+class SkillMatcher:
+    def __init__(self, skills: Iterable[str], aliases: Dict[str, str] = None):
+        skills = frozenset(skills)
+        # Every searchable word maps to the canonical skill it reports
+        self._canonical = {skill: skill for skill in skills}
+        self._canonical.update({alias: skill for alias, skill in (aliases or {}).items() if skill in skills})
+        self._size = len(skills)
+        self._automaton = None
+        self._pattern = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for word, skill in self._canonical.items():
+                self._automaton.add_word(word, (skill, len(word)))
+            self._automaton.make_automaton()
         else:
-            st.error(f"Unsupported file format: {file_ext}")
-            return ""
+            # Single alternation scan when pyahocorasick is not installed.
+            # Longest skills go first so "machine learning" wins over any
+            # shorter prefix, and lookarounds replace \b, which never matches
+            # after the last '+' of "c++". The boundary rule is the automaton's:
+            # [^\W_] is str.isalnum(), plus _WORD_JOINERS before the match
+            alternation = '|'.join(map(re.escape, sorted(self._canonical, key=len, reverse=True)))
+            self._pattern = re.compile(r'(?<![^\W_]|[' + re.escape(_WORD_JOINERS) + r'])(' + alternation + r')(?![^\W_])')
+    
+    def find(self, text_lower: str) -> set:
+        if self._automaton is None:
+            return {self._canonical[word] for word in self._pattern.findall(text_lower)}
+        
+        found = set()
+        last = len(text_lower) - 1
+        for end, (skill, length) in self._automaton.iter(text_lower):
+            # Repeat mentions need no boundary check
+            if skill in found:
+                continue
+            start = end - length + 1
+            # Only accept whole words so "java" doesn't match inside "javascript"
+            if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] in _WORD_JOINERS):
+                continue
+            if end < last and text_lower[end + 1].isalnum():
+                continue
+            found.add(skill)
+            # Nothing left to find, stop scanning the rest of the text
+            if len(found) == self._size:
+                break
+        return found
+
+_RESUME_SKILL_MATCHER = SkillMatcher(TECH_SKILLS, SKILL_ALIASES)
+_JD_SKILL_MATCHER = SkillMatcher(JD_FALLBACK_SKILLS, SKILL_ALIASES)
+
+# One alternation scan for all degrees; only the start is anchored so
+# plurals like "bachelors"/"masters" still count
+_DEGREE_RE = re.compile(r'\b(' + '|'.join(map(re.escape, DEGREES)) + r')')
+
+def _split_skills(skills_text: str) -> set:
+    # Map every delimiter to ',' in one C-level pass, then split once
+    tokens = skills_text.translate(_SKILL_DELIMS).split(',')
+    cleaned = (t.strip().lower() for t in tokens)
+    return {SECTION_SKILL_ALIASES.get(skill, skill) for skill in cleaned
+            if len(skill) > 2 or skill in SECTION_SKILL_ALIASES}
 
 # Parsing Classes
 class ResumeParser:
-    def __init__(self):
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.phone_pattern = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
     
     def parse(self, text: str) -> Resume:
         text = self._clean_text(text)
-        
-        resume_id = hashlib.md5(f"{text[:100]}_{datetime.now()}".encode()).hexdigest()[:12]
+        # Lowercase once here; the skill and education extractors share it
+        text_lower = text.lower()
         
         return Resume(
-            id=resume_id,
+            id=self.generate_id(text),
             name=self._extract_name(text),
             email=self._extract_email(text),
-            skills=self._extract_skills(text),
+            skills=self._extract_skills(text, text_lower),
             experience=self._extract_experience(text),
-            education=self._extract_education(text),
+            education=self._extract_education(text_lower),
             projects=self._extract_projects(text),
             raw_text=text
         )
     
+    def generate_id(self, text: str) -> str:
+        payload = text[:100].encode('utf-8', 'ignore') + datetime.now().isoformat().encode()
+        return hashlib.blake2b(payload, digest_size=6).hexdigest()
+    
     def _clean_text(self, text: str) -> str:
-        return re.sub(r'\s+', ' ', text).strip()
+        return ' '.join(text.split())
     
     def _extract_name(self, text: str) -> str:
-        lines = text.split('\n')
-        if lines:
-            first_line = lines[0].strip()
-            if len(first_line.split()) <= 4 and len(first_line) > 2:
-                return first_line
+        first_line = text.partition('\n')[0].strip()
+        # maxsplit stops tokenising once the line is known to be too long
+        if len(first_line) > 2 and len(first_line.split(None, 4)) <= 4:
+            return first_line
         return "Unknown Candidate"
     
     def _extract_email(self, text: str) -> str:
-        matches = self.email_pattern.findall(text)
+        matches = _EMAIL_RE.findall(text)
         return matches[0] if matches else "No email found"
     
-    def _extract_skills(self, text: str) -> List[str]:
-        # Common technical skills
-        tech_skills = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-            'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws', 'azure',
-            'gcp', 'git', 'jenkins', 'machine learning', 'deep learning', 'nlp',
-            'data science', 'sql', 'mongodb', 'postgresql', 'mysql', 'html', 'css',
-            'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'c++',
-            'devops', 'agile', 'scrum', 'analytics', 'tableau', 'powerbi'
-        ]
-        
-        skills = []
-        text_lower = text.lower()
-        
-        # Find skills mentioned in text
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.append(skill)
+    def _extract_skills(self, text: str, text_lower: str) -> FrozenSet[str]:
+        # Find common technical skills mentioned in text
+        skills = _RESUME_SKILL_MATCHER.find(text_lower)
         
         # Look for skills section
-        skills_match = re.search(r'skills?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)', text, re.IGNORECASE)
+        skills_match = _SKILLS_SECTION_RE.search(text)
         if skills_match:
-            skills_text = skills_match.group(1)
-            extracted_skills = re.split(r'[,;\|\n•\-]', skills_text)
-            for skill in extracted_skills:
-                clean_skill = skill.strip().lower()
-                if len(clean_skill) > 2 and clean_skill not in skills:
-                    skills.append(clean_skill)
+            skills.update(_split_skills(skills_match.group(1)))
         
-        return list(set(skills))
+        return frozenset(skills)
     
     def _extract_experience(self, text: str) -> List[Dict]:
         experience = []
-        exp_match = re.search(r'experience\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)', text, re.IGNORECASE)
+        exp_match = _EXPERIENCE_SECTION_RE.search(text)
         if exp_match:
             exp_text = exp_match.group(1)
             experience.append({"description": exp_text[:300]})
         return experience
     
-    def _extract_education(self, text: str) -> List[Dict]:
-        education = []
-        degrees = ['bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'mba', 'b.e', 'm.e', 'bsc', 'msc']
-        text_lower = text.lower()
-        
-        for degree in degrees:
-            if degree in text_lower:
-                education.append({"degree": degree.upper()})
-        
-        return education
+    def _extract_education(self, text_lower: str) -> List[Dict]:
+        found = set(_DEGREE_RE.findall(text_lower))
+        return [{"degree": degree.upper()} for degree in DEGREES if degree in found]
     
     def _extract_projects(self, text: str) -> List[Dict]:
         projects = []
-        project_match = re.search(r'projects?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)', text, re.IGNORECASE)
+        project_match = _PROJECTS_SECTION_RE.search(text)
         if project_match:
             project_text = project_match.group(1)
             projects.append({"description": project_text[:300]})
@@ -277,10 +373,9 @@ class ResumeParser:
 class JobDescriptionParser:
     def parse(self, text: str, company: str = "", location: str = "") -> JobDescription:
         text = self._clean_text(text)
-        jd_id = hashlib.md5(f"{company}_{text[:100]}_{datetime.now()}".encode()).hexdigest()[:12]
         
         return JobDescription(
-            id=jd_id,
+            id=self.generate_id(text, company),
             title=self._extract_title(text),
             company=company,
             must_have_skills=self._extract_must_have_skills(text),
@@ -290,78 +385,53 @@ class JobDescriptionParser:
             location=location
         )
     
+    def generate_id(self, text: str, company: str = "") -> str:
+        payload = company.encode('utf-8', 'ignore') + text[:100].encode('utf-8', 'ignore') + datetime.now().isoformat().encode()
+        return hashlib.blake2b(payload, digest_size=6).hexdigest()
+    
     def _clean_text(self, text: str) -> str:
-        return re.sub(r'\s+', ' ', text).strip()
+        return ' '.join(text.split())
     
     def _extract_title(self, text: str) -> str:
-        title_patterns = [
-            r'job\s*title\s*:?\s*([^\n]+)',
-            r'position\s*:?\s*([^\n]+)',
-            r'role\s*:?\s*([^\n]+)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
         # Fallback to first line
-        lines = text.split('\n')
-        if lines and len(lines[0]) <= 80:
-            return lines[0].strip()
+        first_line = text.partition('\n')[0]
+        if len(first_line) <= 80:
+            return first_line.strip()
         
         return "Software Developer"
     
-    def _extract_must_have_skills(self, text: str) -> List[str]:
-        patterns = [
-            r'required\s*skills?\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-            r'must\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-            r'mandatory\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-        ]
-        
-        skills = []
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_must_have_skills(self, text: str) -> FrozenSet[str]:
+        skills = set()
+        for pattern in _MUST_HAVE_PATTERNS:
+            match = pattern.search(text)
             if match:
-                skills_text = match.group(1)
-                extracted = re.split(r'[,;\|\n•\-]', skills_text)
-                skills.extend([s.strip().lower() for s in extracted if s.strip() and len(s.strip()) > 2])
+                skills = _split_skills(match.group(1))
                 break
         
         # If no specific section found, extract common tech skills
         if not skills:
-            tech_skills = ['python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker']
-            text_lower = text.lower()
-            skills = [skill for skill in tech_skills if skill in text_lower]
+            skills = _JD_SKILL_MATCHER.find(text.lower())
         
-        return list(set(skills))[:15]
+        return frozenset(list(skills)[:15])
     
-    def _extract_good_to_have_skills(self, text: str) -> List[str]:
-        patterns = [
-            r'good\s*to\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-            r'preferred\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-            r'nice\s*to\s*have\s*:?\s*([^\n]+(?:\n[^\n]*)*?)(?:\n\s*\n|\Z)',
-        ]
-        
-        skills = []
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_good_to_have_skills(self, text: str) -> FrozenSet[str]:
+        skills = set()
+        for pattern in _GOOD_TO_HAVE_PATTERNS:
+            match = pattern.search(text)
             if match:
-                skills_text = match.group(1)
-                extracted = re.split(r'[,;\|\n•\-]', skills_text)
-                skills.extend([s.strip().lower() for s in extracted if s.strip() and len(s.strip()) > 2])
+                skills = _split_skills(match.group(1))
                 break
         
-        return list(set(skills))[:10]
+        return frozenset(list(skills)[:10])
     
     def _extract_experience_requirement(self, text: str) -> str:
-        exp_patterns = [
-            r'(\d+[\+\-]?\d*)\s*years?\s*(?:of\s*)?experience',
-            r'experience\s*:?\s*(\d+[\+\-]?\d*)\s*years?',
-        ]
-        
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EXP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1) + " years"
         
@@ -370,41 +440,82 @@ class JobDescriptionParser:
 # Evaluation Class
 class RelevanceEvaluator:
     def evaluate(self, resume: Resume, job_desc: JobDescription) -> EvaluationResult:
-        # Calculate skill matches
-        resume_skills = set([s.lower() for s in resume.skills])
-        must_have_skills = set([s.lower() for s in job_desc.must_have_skills])
-        good_to_have_skills = set([s.lower() for s in job_desc.good_to_have_skills])
+        return self.evaluate_batch([resume], [job_desc])[0][0]
+    
+    def evaluate_batch(self, resumes: List[Resume], job_descs: List[JobDescription]) -> List[List[EvaluationResult]]:
+        # Only JD skills can affect a score, so they alone form the columns
+        skill_names = np.array(sorted(frozenset().union(*[jd.must_have_skills | jd.good_to_have_skills for jd in job_descs])), dtype=object)
+        vocab = {skill: col for col, skill in enumerate(skill_names)}
+        job_skills = frozenset(vocab)
         
-        matched_must_have = resume_skills.intersection(must_have_skills)
-        matched_good_to_have = resume_skills.intersection(good_to_have_skills)
-        matched_skills = list(matched_must_have.union(matched_good_to_have))
+        # Boolean (N, V) and (M, V) skill matrices (skills are lowercased at parse time)
+        resume_mat = self._skill_matrix([self._align_skills(r.skills, job_skills) for r in resumes], vocab)
+        must_have_mat = self._skill_matrix([jd.must_have_skills for jd in job_descs], vocab)
+        good_to_have_mat = self._skill_matrix([jd.good_to_have_skills for jd in job_descs], vocab)
         
-        missing_must_have = must_have_skills - resume_skills
-        missing_skills = list(missing_must_have)
+        # (N, M, V) masks for every resume/JD pair
+        matched_must_have = resume_mat[:, None, :] & must_have_mat[None, :, :]
+        matched_good_to_have = resume_mat[:, None, :] & good_to_have_mat[None, :, :]
+        missing_must_have = ~resume_mat[:, None, :] & must_have_mat[None, :, :]
+        matched = matched_must_have | matched_good_to_have
+        
+        must_have_counts = must_have_mat.sum(axis=1)
+        good_to_have_counts = good_to_have_mat.sum(axis=1)
         
         # Calculate score
-        score = 0
+        scores = np.zeros((len(resumes), len(job_descs)))
         
         # Must-have skills (50 points)
-        if must_have_skills:
-            score += (len(matched_must_have) / len(must_have_skills)) * 50
+        scores += np.divide(matched_must_have.sum(axis=2), must_have_counts, out=np.zeros_like(scores), where=must_have_counts > 0) * 50
         
         # Good-to-have skills (20 points)
-        if good_to_have_skills:
-            score += (len(matched_good_to_have) / len(good_to_have_skills)) * 20
+        scores += np.divide(matched_good_to_have.sum(axis=2), good_to_have_counts, out=np.zeros_like(scores), where=good_to_have_counts > 0) * 20
         
         # Experience (15 points)
-        if resume.experience:
-            score += 15
+        scores += np.array([15 if r.experience else 0 for r in resumes], dtype=float)[:, None]
         
         # Education (10 points)
-        if resume.education:
-            score += 10
+        scores += np.array([10 if r.education else 0 for r in resumes], dtype=float)[:, None]
         
         # Projects (5 points)
-        if resume.projects:
-            score += 5
-        
+        scores += np.array([5 if r.projects else 0 for r in resumes], dtype=float)[:, None]
+        
+        return [
+            [
+                self._build_result(resume, job_desc, float(scores[i, j]),
+                                   skill_names[matched[i, j]].tolist(),
+                                   skill_names[missing_must_have[i, j]].tolist())
+                for j, job_desc in enumerate(job_descs)
+            ]
+            for i, resume in enumerate(resumes)
+        ]
+    
+    def _align_skills(self, resume_skills: FrozenSet[str], job_skills: FrozenSet[str]) -> FrozenSet[str]:
+        # Credit job skills the resume only spells slightly differently
+        # (typos, "kubernets", "java script") using rapidfuzz's normalized ratio
+        unmatched = [skill for skill in job_skills
+                     if skill not in resume_skills and len(skill) >= FUZZY_MIN_SKILL_LENGTH]
+        if not RAPIDFUZZ_AVAILABLE or not unmatched or not resume_skills:
+            return resume_skills
+        
+        candidates = list(resume_skills)
+        scores = process.cdist(candidates, unmatched, scorer=fuzz.ratio, score_cutoff=FUZZY_SKILL_CUTOFF)
+        cutoffs = np.array([FUZZY_SKILL_CUTOFF if len(skill) >= FUZZY_LONG_SKILL_LENGTH else FUZZY_SHORT_SKILL_CUTOFF
+                            for skill in unmatched])
+        # A near-miss spelling must also start with the same character
+        same_initial = np.array([[candidate[:1] == skill[:1] for skill in unmatched] for candidate in candidates])
+        close = [unmatched[j] for j in np.flatnonzero(((scores >= cutoffs) & same_initial).any(axis=0))]
+        return resume_skills | frozenset(close)
+    
+    @staticmethod
+    def _skill_matrix(skill_sets: List[FrozenSet[str]], vocab: Dict[str, int]) -> np.ndarray:
+        matrix = np.zeros((len(skill_sets), len(vocab)), dtype=bool)
+        for row, skills in enumerate(skill_sets):
+            matrix[row, [vocab[skill] for skill in skills if skill in vocab]] = True
+        return matrix
+    
+    def _build_result(self, resume: Resume, job_desc: JobDescription, score: float,
+                      matched_skills: List[str], missing_skills: List[str]) -> EvaluationResult:
         score = min(100, score)
         verdict = "HIGH" if score >= 75 else "MEDIUM" if score >= 50 else "LOW"
         
@@ -457,6 +568,38 @@ resume_parser = ResumeParser()
 job_parser = JobDescriptionParser()
 evaluator = RelevanceEvaluator()
 
+# Cached wrappers: Streamlit reruns the script on every interaction, so
+# repeated extraction/parsing of the same upload becomes a cache lookup
+@st.cache_data(show_spinner=False, max_entries=128)
+def _extract_text_cached(file_bytes: bytes, file_ext: str) -> str:
+    if file_ext == 'pdf':
+        return DocumentProcessor.extract_text_from_pdf(file_bytes)
+    elif file_ext in ['docx', 'doc']:
+        return DocumentProcessor.extract_text_from_docx(file_bytes)
+    elif file_ext == 'txt':
+        return file_bytes.decode('utf-8')
+    else:
+        st.error(f"Unsupported file format: {file_ext}")
+        return ""
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _parse_resume_cached(text: str) -> Resume:
+    return resume_parser.parse(text)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _parse_job_description_cached(text: str, company: str, location: str) -> JobDescription:
+    return job_parser.parse(text, company, location)
+
+# The cached parse keeps the ID from its first run, so every call gets a
+# fresh timestamped ID outside the cache
+def _parse_resume(text: str) -> Resume:
+    resume = _parse_resume_cached(text)
+    return replace(resume, id=resume_parser.generate_id(resume.raw_text))
+
+def _parse_job_description(text: str, company: str, location: str) -> JobDescription:
+    job_desc = _parse_job_description_cached(text, company, location)
+    return replace(job_desc, id=job_parser.generate_id(job_desc.description, company))
+
 # Main App
 def main():
     st.markdown('<h1 class="main-header">🎯 Resume Relevance Check System</h1>', unsafe_allow_html=True)
@@ -528,7 +671,7 @@ def upload_job_description():
         
         with st.spinner("Parsing job description..."):
             try:
-                job_desc = job_parser.parse(jd_text, company, location)
+                job_desc = _parse_job_description(jd_text, company, location)
                 st.session_state.job_descriptions.append(job_desc)
                 
                 st.success("Job description parsed successfully!")
@@ -560,7 +703,7 @@ def upload_job_description():
                 st.error(f"Error parsing job description: {str(e)}")
 
 def upload_resume():
-    st.header("📄 Upload Resume for Evaluation")
+    st.header("📄 Upload Resumes for Evaluation")
     
     if not st.session_state.job_descriptions:
         st.warning("Please upload at least one job description first!")
@@ -594,37 +737,46 @@ def upload_resume():
                 st.write("None specified")
     
     # Resume upload
-    uploaded_resume = st.file_uploader(
-        "Upload Resume",
+    uploaded_resumes = st.file_uploader(
+        "Upload Resumes",
         type=['pdf', 'docx', 'txt'],
-        help="Supported formats: PDF, DOCX, TXT"
+        accept_multiple_files=True,
+        help="Supported formats: PDF, DOCX, TXT. Select several files to evaluate them together."
     )
     
-    if uploaded_resume and st.button("Evaluate Resume", type="primary"):
-        with st.spinner("Processing resume..."):
+    if uploaded_resumes and st.button("Evaluate Resumes", type="primary"):
+        with st.spinner("Processing resumes..."):
             try:
-                # Extract text
-                resume_text = DocumentProcessor.extract_text(uploaded_resume)
-                if not resume_text:
-                    st.error("Could not extract text from the resume. Please try a different file.")
-                    return
+                resumes = []
+                file_names = []
+                for uploaded_resume in uploaded_resumes:
+                    # Extract text
+                    resume_text = DocumentProcessor.extract_text(uploaded_resume)
+                    if not resume_text:
+                        st.error(f"Could not extract text from {uploaded_resume.name}. Please try a different file.")
+                        continue
+                    
+                    # Parse resume
+                    resumes.append(_parse_resume(resume_text))
+                    file_names.append(uploaded_resume.name)
                 
-                # Parse resume
-                resume = resume_parser.parse(resume_text)
+                if not resumes:
+                    return
                 
-                # Evaluate resume
-                evaluation = evaluator.evaluate(resume, selected_job)
-                st.session_state.evaluations.append(evaluation)
+                # Evaluate all resumes against the selected job in one batch
+                evaluations = [row[0] for row in evaluator.evaluate_batch(resumes, [selected_job])]
+                st.session_state.evaluations.extend(evaluations)
                 
                 # Display results
-                st.success("Resume evaluated successfully!")
-                display_evaluation_result(evaluation, resume, selected_job)
+                st.success(f"{len(evaluations)} resume(s) evaluated successfully!")
+                for file_name, resume, evaluation in zip(file_names, resumes, evaluations):
+                    display_evaluation_result(evaluation, resume, selected_job, file_name)
                 
             except Exception as e:
-                st.error(f"Error processing resume: {str(e)}")
+                st.error(f"Error processing resumes: {str(e)}")
 
-def display_evaluation_result(evaluation: EvaluationResult, resume: Resume, job: JobDescription):
-    st.header("📊 Evaluation Results")
+def display_evaluation_result(evaluation: EvaluationResult, resume: Resume, job: JobDescription, file_name: str = ""):
+    st.header(f"📊 Evaluation Results: {file_name}" if file_name else "📊 Evaluation Results")
     
     # Score display
     col1, col2, col3 = st.columns(3)
@@ -685,11 +837,14 @@ def view_results():
         st.info("No evaluations yet. Upload some resumes to see results here.")
         return
     
+    evaluations = st.session_state.evaluations
+    
     # Statistics
-    total = len(st.session_state.evaluations)
-    high_count = len([e for e in st.session_state.evaluations if e.verdict == "HIGH"])
-    medium_count = len([e for e in st.session_state.evaluations if e.verdict == "MEDIUM"])
-    low_count = len([e for e in st.session_state.evaluations if e.verdict == "LOW"])
+    total = len(evaluations)
+    verdict_counts = Counter(e.verdict for e in evaluations)
+    high_count = verdict_counts["HIGH"]
+    medium_count = verdict_counts["MEDIUM"]
+    low_count = verdict_counts["LOW"]
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -701,22 +856,18 @@ def view_results():
     # Results table
     st.subheader("Evaluation Summary")
     
-    results_data = []
-    for eval in st.session_state.evaluations:
-        # Find corresponding job
-        job = next((jd for jd in st.session_state.job_descriptions if jd.id == eval.job_id), None)
-        job_title = job.title if job else "Unknown Job"
-        
-        results_data.append({
-            "Job": job_title,
-            "Score": f"{eval.relevance_score}%",
-            "Verdict": eval.verdict,
-            "Matched Skills": len(eval.matched_skills),
-            "Missing Skills": len(eval.missing_skills)
-        })
-    
-    if results_data:
-        st.dataframe(results_data, use_container_width=True)
+    # Look up job titles by ID once instead of scanning per row
+    title_by_id = {jd.id: jd.title for jd in st.session_state.job_descriptions}
+    
+    results_df = pd.DataFrame({
+        "Job": [title_by_id.get(e.job_id, "Unknown Job") for e in evaluations],
+        "Score": [f"{e.relevance_score}%" for e in evaluations],
+        "Verdict": [e.verdict for e in evaluations],
+        "Matched Skills": [len(e.matched_skills) for e in evaluations],
+        "Missing Skills": [len(e.missing_skills) for e in evaluations]
+    })
+    
+    st.dataframe(results_df, use_container_width=True)
 
 def about_page():
     st.header("ℹ️ About Resume Relevance Check System")